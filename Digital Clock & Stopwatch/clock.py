@@ -2,13 +2,16 @@ import tkinter as tk
 from tkinter import ttk
 import time
 
+# Timer source for the clock and stopwatch; anything with Tk's after/after_cancel
+scheduler = None
+
 # -----------------------------
 # Digital Clock Function
 # -----------------------------
 def update_clock():
     current_time = time.strftime("%H:%M:%S")
     clock_label.config(text=current_time)
-    clock_label.after(1000, update_clock)
+    scheduler.after(1000, update_clock)
 
 # -----------------------------
 # Stopwatch Functions
@@ -27,7 +30,7 @@ def start_stopwatch():
 def stop_stopwatch():
     global running
     if running:
-        window.after_cancel(update_job)
+        scheduler.after_cancel(update_job)
         running = False
 
 def reset_stopwatch():
@@ -41,34 +44,40 @@ def update_stopwatch():
     elapsed_time = time.time() - start_time
     formatted = time.strftime("%H:%M:%S", time.gmtime(elapsed_time))
     stopwatch_label.config(text=formatted)
-    update_job = window.after(1000, update_stopwatch)
+    update_job = scheduler.after(1000, update_stopwatch)
 
 # -----------------------------
 # GUI Setup
 # -----------------------------
-window = tk.Tk()
-window.title("Digital Clock & Stopwatch")
-window.geometry("400x300")
-window.configure(bg="#1e1e1e")
+def build(window, timer=None):
+    global scheduler, clock_label, stopwatch_label
+    scheduler = timer or window
+    window.configure(bg="#1e1e1e")
+
+    title = tk.Label(window, text="Digital Clock & Stopwatch", font=("Arial", 18, "bold"), fg="white", bg="#1e1e1e")
+    title.pack(pady=10)
 
-title = tk.Label(window, text="Digital Clock & Stopwatch", font=("Arial", 18, "bold"), fg="white", bg="#1e1e1e")
-title.pack(pady=10)
+    # Clock UI
+    clock_label = tk.Label(window, font=("Arial", 40, "bold"), fg="#00ff00", bg="#1e1e1e")
+    clock_label.pack(pady=5)
 
-# Clock UI
-clock_label = tk.Label(window, font=("Arial", 40, "bold"), fg="#00ff00", bg="#1e1e1e")
-clock_label.pack(pady=5)
+    # Stopwatch UI
+    stopwatch_label = tk.Label(window, text="00:00:00", font=("Arial", 40, "bold"), fg="#00c8ff", bg="#1e1e1e")
+    stopwatch_label.pack(pady=5)
 
-# Stopwatch UI
-stopwatch_label = tk.Label(window, text="00:00:00", font=("Arial", 40, "bold"), fg="#00c8ff", bg="#1e1e1e")
-stopwatch_label.pack(pady=5)
+    # Buttons
+    button_frame = ttk.Frame(window)
+    button_frame.pack(pady=10)
 
-# Buttons
-button_frame = ttk.Frame(window)
-button_frame.pack(pady=10)
+    ttk.Button(button_frame, text="Start", command=start_stopwatch).grid(row=0, column=0, padx=5)
+    ttk.Button(button_frame, text="Stop", command=stop_stopwatch).grid(row=0, column=1, padx=5)
+    ttk.Button(button_frame, text="Reset", command=reset_stopwatch).grid(row=0, column=2, padx=5)
 
-ttk.Button(button_frame, text="Start", command=start_stopwatch).grid(row=0, column=0, padx=5)
-ttk.Button(button_frame, text="Stop", command=stop_stopwatch).grid(row=0, column=1, padx=5)
-ttk.Button(button_frame, text="Reset", command=reset_stopwatch).grid(row=0, column=2, padx=5)
+    update_clock()
 
-update_clock()
-window.mainloop()
+if __name__ == "__main__":
+    window = tk.Tk()
+    window.title("Digital Clock & Stopwatch")
+    window.geometry("400x300")
+    build(window)
+    window.mainloop()
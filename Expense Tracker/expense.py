@@ -54,46 +54,51 @@ def load_table():
 # -----------------------------
 # UI Setup
 # -----------------------------
-window = tk.Tk()
-window.title("Expense Tracker")
-window.geometry("600x500")
-window.configure(bg="#1e1e1e")
+def build(window):
+    global category_var, amount_var, note_var, expense_table
+    window.configure(bg="#1e1e1e")
 
-title = tk.Label(window, text="Expense Tracker", font=("Arial", 20, "bold"), bg="#1e1e1e", fg="white")
-title.pack(pady=10)
+    title = tk.Label(window, text="Expense Tracker", font=("Arial", 20, "bold"), bg="#1e1e1e", fg="white")
+    title.pack(pady=10)
 
-frame = ttk.Frame(window)
-frame.pack(pady=5)
+    frame = ttk.Frame(window)
+    frame.pack(pady=5)
 
-# User Input Fields
-ttk.Label(frame, text="Category:").grid(row=0, column=0, padx=5, pady=5)
-category_var = tk.StringVar()
-category_dropdown = ttk.Combobox(frame, textvariable=category_var, state="readonly", width=20)
-category_dropdown["values"] = ["Food", "Transport", "Shopping", "Bills", "Others"]
-category_dropdown.grid(row=0, column=1)
+    # User Input Fields
+    ttk.Label(frame, text="Category:").grid(row=0, column=0, padx=5, pady=5)
+    category_var = tk.StringVar()
+    category_dropdown = ttk.Combobox(frame, textvariable=category_var, state="readonly", width=20)
+    category_dropdown["values"] = ["Food", "Transport", "Shopping", "Bills", "Others"]
+    category_dropdown.grid(row=0, column=1)
 
-ttk.Label(frame, text="Amount:").grid(row=1, column=0, padx=5, pady=5)
-amount_var = tk.StringVar()
-amount_entry = ttk.Entry(frame, textvariable=amount_var)
-amount_entry.grid(row=1, column=1)
+    ttk.Label(frame, text="Amount:").grid(row=1, column=0, padx=5, pady=5)
+    amount_var = tk.StringVar()
+    amount_entry = ttk.Entry(frame, textvariable=amount_var)
+    amount_entry.grid(row=1, column=1)
 
-ttk.Label(frame, text="Note:").grid(row=2, column=0, padx=5, pady=5)
-note_var = tk.StringVar()
-note_entry = ttk.Entry(frame, textvariable=note_var, width=25)
-note_entry.grid(row=2, column=1)
+    ttk.Label(frame, text="Note:").grid(row=2, column=0, padx=5, pady=5)
+    note_var = tk.StringVar()
+    note_entry = ttk.Entry(frame, textvariable=note_var, width=25)
+    note_entry.grid(row=2, column=1)
 
-# Button
-ttk.Button(frame, text="Add Expense", command=save_expense).grid(row=3, column=0, columnspan=2, pady=10)
+    # Button
+    ttk.Button(frame, text="Add Expense", command=save_expense).grid(row=3, column=0, columnspan=2, pady=10)
 
-# Table
-columns = ["Date", "Category", "Amount", "Note"]
-expense_table = ttk.Treeview(window, columns=columns, show="headings")
+    # Table
+    columns = ["Date", "Category", "Amount", "Note"]
+    expense_table = ttk.Treeview(window, columns=columns, show="headings")
 
-for col in columns:
-    expense_table.heading(col, text=col)
-    expense_table.column(col, width=130)
+    for col in columns:
+        expense_table.heading(col, text=col)
+        expense_table.column(col, width=130)
 
-expense_table.pack(pady=10, fill="both", expand=True)
+    expense_table.pack(pady=10, fill="both", expand=True)
 
-load_table()
-window.mainloop()
+    load_table()
+
+if __name__ == "__main__":
+    window = tk.Tk()
+    window.title("Expense Tracker")
+    window.geometry("600x500")
+    build(window)
+    window.mainloop()
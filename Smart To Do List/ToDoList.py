@@ -23,17 +23,17 @@ import threading
 import time
 import csv
 import sys
+from collections import OrderedDict
 
-# Try system notifications via plyer (optional)
-try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
-except Exception:
-    PLYER_AVAILABLE = False
+# System notifications via plyer (optional); imported on first notification
+notification = None
+PLYER_AVAILABLE = None
 
 DATA_FILE = Path("tasks.json")
 REMINDER_CHECK_INTERVAL = 30  # seconds
 REMINDER_LOOKAHEAD = 1  # minutes to pop reminder for tasks due within this window
+VIEW_MARGIN = 100  # Treeview rows kept above and below the visible ones
+DETAILS_CACHE_SIZE = 256  # formatted detail strings kept per task id
 
 # ---------------------------
 # Task storage / management
@@ -42,6 +42,7 @@ class TaskManager:
     def __init__(self, path=DATA_FILE):
         self.path = Path(path)
         self.tasks = []  # list of dicts
+        self._by_id = {}  # task id -> task dict
         self._load()
 
     def _load(self):
@@ -59,6 +60,7 @@ class TaskManager:
                 self.tasks = []
         else:
             self.tasks = []
+        self._by_id = {t["id"]: t for t in self.tasks}
 
     def save(self):
         with open(self.path, "w", encoding="utf-8") as f:
@@ -75,23 +77,26 @@ class TaskManager:
             "reminded": False  # whether reminder already showed
         }
         self.tasks.append(task)
+        self._by_id[task["id"]] = task
         self.save()
         return task
 
     def update_task(self, task_id, **fields):
-        for t in self.tasks:
-            if t["id"] == task_id:
-                t.update(fields)
-                self.save()
-                return t
-        raise KeyError("Task not found")
+        t = self._by_id.get(task_id)
+        if t is None:
+            raise KeyError("Task not found")
+        t.update(fields)
+        self.save()
+        return t
 
     def delete_task(self, task_id):
-        before = len(self.tasks)
-        self.tasks = [t for t in self.tasks if t["id"] != task_id]
-        if len(self.tasks) != before:
+        if self._by_id.pop(task_id, None) is not None:
+            self.tasks = [t for t in self.tasks if t["id"] != task_id]
             self.save()
 
+    def get(self, task_id):
+        return self._by_id.get(task_id)
+
     def get_all(self):
         return list(self.tasks)
 
@@ -107,8 +112,18 @@ class TaskManager:
 # ---------------------------
 # Notification helper
 # ---------------------------
+def _load_plyer():
+    global notification, PLYER_AVAILABLE
+    if PLYER_AVAILABLE is None:
+        try:
+            from plyer import notification
+            PLYER_AVAILABLE = True
+        except Exception:
+            PLYER_AVAILABLE = False
+    return PLYER_AVAILABLE
+
 def notify(title, message):
-    if PLYER_AVAILABLE:
+    if _load_plyer():
         try:
             notification.notify(title=title, message=message, timeout=8)
             return
@@ -132,18 +147,117 @@ def notify(title, message):
         except Exception:
             print(f"[NOTIFY] {title}: {message}", file=sys.stderr)
 
+# ---------------------------
+# Windowed Treeview
+# ---------------------------
+class TaskListView:
+    """Materializes Treeview items only around the visible rows.
+
+    The tree scrolls natively inside the block of items it holds; its
+    yscrollcommand reports the position and the block is re-centred before
+    the view reaches either edge. The scrollbar maps onto the full list.
+    """
+
+    def __init__(self, tree, scrollbar, margin=VIEW_MARGIN):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.margin = margin
+        self.rows = []  # sorted task dicts shown in the view
+        self.start = self.end = 0  # rows[start:end] exist as tree items
+        self.top = 0  # first visible row
+        self.visible = 30  # visible row count, updated from scroll events
+        self.selected_id = None  # kept while the selected row is not materialized
+        self._recenter_pending = False
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        scrollbar.configure(command=self._on_scrollbar)
+
+    def set_rows(self, rows):
+        self.rows = rows
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self.start = self.end = 0
+        if self.selected_id is not None and not any(t["id"] == self.selected_id for t in rows):
+            self.selected_id = None
+        self._materialize(min(self.top, max(0, len(rows) - self.visible)))
+
+    def _insert(self, index, t):
+        status = "Done" if t.get("completed") else "Pending"
+        deadline = t.get("deadline") or ""
+        tag = t.get("priority","Medium").lower()
+        if t.get("completed"):
+            tags = (tag, "completed")
+        else:
+            tags = (tag,)
+        self.tree.insert("", index, iid=str(t["id"]), values=(t["title"], deadline, t["priority"], status), tags=tags)
+
+    def _materialize(self, top):
+        total = len(self.rows)
+        start = max(0, top - self.margin)
+        end = min(total, top + self.visible + self.margin)
+        children = self.tree.get_children()
+        if start >= self.end or end <= self.start:
+            if children:
+                self.tree.delete(*children)
+            for t in self.rows[start:end]:
+                self._insert("end", t)
+        else:
+            # drop rows that left the block, then add the ones entering it
+            stale = children[:max(0, start - self.start)] + children[len(children) - max(0, self.end - end):]
+            if stale:
+                self.tree.delete(*stale)
+            for i, t in enumerate(self.rows[start:self.start]):
+                self._insert(i, t)
+            for t in self.rows[self.end:end]:
+                self._insert("end", t)
+        self.start, self.end = start, end
+        self.top = top
+        if end > start:
+            self.tree.yview_moveto((top - start) / (end - start))
+        if self.selected_id is not None:
+            iid = str(self.selected_id)
+            if self.tree.exists(iid) and self.tree.selection() != (iid,):
+                self.tree.selection_set(iid)
+
+    def _on_tree_scroll(self, lo, hi):
+        total = len(self.rows)
+        size = self.end - self.start
+        if not size:
+            self.scrollbar.set(0, 1)
+            return
+        top = self.start + round(float(lo) * size)
+        bottom = self.start + round(float(hi) * size)
+        self.top = top
+        self.visible = max(1, bottom - top)
+        self.scrollbar.set(top / total, bottom / total)
+        near_start = self.start > 0 and top - self.start < self.margin // 2
+        near_end = self.end < total and self.end - bottom < self.margin // 2
+        if (near_start or near_end) and not self._recenter_pending:
+            self._recenter_pending = True
+            self.tree.after_idle(self._recenter)
+
+    def _recenter(self):
+        self._recenter_pending = False
+        self._materialize(self.top)
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            total = len(self.rows)
+            top = int(float(args[1]) * total)
+            self._materialize(max(0, min(top, total - self.visible)))
+        else:
+            self.tree.yview(*args)
+
 # ---------------------------
 # Tkinter UI
 # ---------------------------
-class SmartToDoApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Smart To-Do List")
-        self.geometry("900x560")
-        self.minsize(700, 450)
+class SmartToDoApp(ttk.Frame):
+    def __init__(self, master=None):
+        super().__init__(master)
         self.style = ttk.Style(self)
         # Use default theme; user can customize later
         self.task_manager = TaskManager()
+        self._details_cache = OrderedDict()  # task id -> formatted details, LRU order
         self._build_ui()
         self._load_tasks_into_view()
         self._start_reminder_thread()
@@ -195,8 +309,8 @@ class SmartToDoApp(tk.Tk):
         self.tree.column("priority", width=100, anchor="center")
         self.tree.column("status", width=80, anchor="center")
 
-        vsb = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscroll=vsb.set)
+        vsb = ttk.Scrollbar(container, orient="vertical")
+        self.view = TaskListView(self.tree, vsb)
         vsb.pack(side="right", fill="y")
         self.tree.pack(fill="both", expand=True, side="left")
 
@@ -212,14 +326,12 @@ class SmartToDoApp(tk.Tk):
         self.details_label = ttk.Label(bottom, text="Select a task to view details.", anchor="w")
         self.details_label.pack(fill="x")
 
-        self.tree.bind("<<TreeviewSelect>>", lambda e: self._show_selected_details())
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self._on_tree_select())
 
     # ---------------------------
     # Task view population
     # ---------------------------
     def _load_tasks_into_view(self, tasks=None):
-        for r in self.tree.get_children():
-            self.tree.delete(r)
         tasks = tasks if tasks is not None else self.task_manager.get_all()
         # sort: uncompleted first, then by deadline (None at end)
         def sort_key(t):
@@ -230,21 +342,21 @@ class SmartToDoApp(tk.Tk):
                 dt = None
             return (t.get("completed", False), dt or datetime.max, {"High":0,"Medium":1,"Low":2}.get(t.get("priority","Medium"),1))
         tasks_sorted = sorted(tasks, key=sort_key)
-        for t in tasks_sorted:
-            status = "Done" if t.get("completed") else "Pending"
-            deadline = t.get("deadline") or ""
-            tag = t.get("priority","Medium").lower()
-            if t.get("completed"):
-                tags = (tag, "completed")
-            else:
-                tags = (tag,)
-            self.tree.insert("", "end", iid=str(t["id"]), values=(t["title"], deadline, t["priority"], status), tags=tags)
+        self.view.set_rows(tasks_sorted)
+        self._show_selected_details()
+
+    def _on_tree_select(self):
+        sel = self.tree.selection()
+        # an empty selection only means the selected row scrolled out of the window
+        if sel:
+            self.view.selected_id = int(sel[0])
+            self._show_selected_details()
 
     # ---------------------------
     # Actions
     # ---------------------------
     def _on_add_task(self):
-        dlg = TaskDialog(self, "Add Task")
+        dlg = TaskDialog(self.winfo_toplevel(), "Add Task")
         self.wait_window(dlg)
         if dlg.result:
             title, deadline, priority, notes = dlg.result
@@ -258,16 +370,15 @@ class SmartToDoApp(tk.Tk):
                 messagebox.showerror("Invalid date", "Deadline must be in format YYYY-MM-DD HH:MM")
 
     def _on_edit_task(self):
-        sel = self.tree.selection()
-        if not sel:
+        task_id = self.view.selected_id
+        if task_id is None:
             messagebox.showinfo("Edit Task", "Please select a task to edit.")
             return
-        task_id = int(sel[0])
-        t = next((x for x in self.task_manager.get_all() if x["id"] == task_id), None)
+        t = self.task_manager.get(task_id)
         if not t:
             messagebox.showerror("Error", "Task not found.")
             return
-        dlg = TaskDialog(self, "Edit Task", prefill=t)
+        dlg = TaskDialog(self.winfo_toplevel(), "Edit Task", prefill=t)
         self.wait_window(dlg)
         if dlg.result:
             title, deadline, priority, notes = dlg.result
@@ -275,31 +386,32 @@ class SmartToDoApp(tk.Tk):
                 if deadline:
                     _ = datetime.strptime(deadline, "%Y-%m-%d %H:%M")
                 self.task_manager.update_task(task_id, title=title, deadline=deadline, priority=priority, notes=notes)
+                self._details_cache.pop(task_id, None)
                 self._load_tasks_into_view()
             except ValueError:
                 messagebox.showerror("Invalid date", "Deadline must be in format YYYY-MM-DD HH:MM")
 
     def _on_delete_task(self):
-        sel = self.tree.selection()
-        if not sel:
+        task_id = self.view.selected_id
+        if task_id is None:
             messagebox.showinfo("Delete Task", "Please select a task to delete.")
             return
-        task_id = int(sel[0])
         if messagebox.askyesno("Delete Task", "Are you sure you want to delete the selected task?"):
             self.task_manager.delete_task(task_id)
+            self._details_cache.pop(task_id, None)
             self._load_tasks_into_view()
             self.details_label.config(text="Task deleted.")
 
     def _on_toggle_complete(self):
-        sel = self.tree.selection()
-        if not sel:
+        task_id = self.view.selected_id
+        if task_id is None:
             messagebox.showinfo("Toggle Complete", "Please select a task.")
             return
-        task_id = int(sel[0])
-        t = next((x for x in self.task_manager.get_all() if x["id"] == task_id), None)
+        t = self.task_manager.get(task_id)
         if t:
             new_state = not t.get("completed", False)
             self.task_manager.mark_complete(task_id, completed=new_state)
+            self._details_cache.pop(task_id, None)
             self._load_tasks_into_view()
 
     def _on_search(self):
@@ -353,12 +465,16 @@ class SmartToDoApp(tk.Tk):
     # Details
     # ---------------------------
     def _show_selected_details(self):
-        sel = self.tree.selection()
-        if not sel:
+        task_id = self.view.selected_id
+        if task_id is None:
             self.details_label.config(text="Select a task to view details.")
             return
-        task_id = int(sel[0])
-        t = next((x for x in self.task_manager.get_all() if x["id"] == task_id), None)
+        txt = self._details_cache.get(task_id)
+        if txt is not None:
+            self._details_cache.move_to_end(task_id)
+            self.details_label.config(text=txt)
+            return
+        t = self.task_manager.get(task_id)
         if not t:
             self.details_label.config(text="Task not found.")
             return
@@ -366,6 +482,9 @@ class SmartToDoApp(tk.Tk):
         deadline = t.get("deadline") or "No deadline"
         notes = t.get("notes","")
         txt = f"Title: {t.get('title')}    |    Priority: {t.get('priority')}    |    Status: {status}\nDeadline: {deadline}\nNotes: {notes}"
+        self._details_cache[task_id] = txt
+        if len(self._details_cache) > DETAILS_CACHE_SIZE:
+            self._details_cache.popitem(last=False)
         self.details_label.config(text=txt)
 
     # ---------------------------
@@ -419,7 +538,7 @@ class SmartToDoApp(tk.Tk):
 
     def on_closing(self):
         self._stop_thread = True
-        self.destroy()
+        self.winfo_toplevel().destroy()
 
 # ---------------------------
 # Dialog for Add/Edit
@@ -484,10 +603,19 @@ class TaskDialog(tk.Toplevel):
 # ---------------------------
 # Main
 # ---------------------------
+def build(parent):
+    app = SmartToDoApp(parent)
+    app.pack(fill="both", expand=True)
+    return app
+
 def main():
-    app = SmartToDoApp()
-    app.protocol("WM_DELETE_WINDOW", app.on_closing)
-    app.mainloop()
+    root = tk.Tk()
+    root.title("Smart To-Do List")
+    root.geometry("900x560")
+    root.minsize(700, 450)
+    app = build(root)
+    root.protocol("WM_DELETE_WINDOW", app.on_closing)
+    root.mainloop()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+launcher.py
+Runs the calculator, expense tracker, to-do list and clock as tabs of one Tk root.
+
+- Each tool is imported and built the first time its tab is opened
+- All timers go through one shared Scheduler (a single Tk `after` job)
+- `python launcher.py --measure` compares cold start against the separate scripts
+- `python launcher.py --profile [out.json]` records event-loop latency (F12 shows it)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import importlib.util
+import subprocess
+import heapq
+import itertools
+import math
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+
+# (tab label, module name, script path, takes the shared scheduler)
+TOOLS = [
+    ("Calculator", "calculator", ROOT_DIR / "calculator" / "calculator.py", False),
+    ("Expenses", "expense", ROOT_DIR / "Expense Tracker" / "expense.py", False),
+    ("To-Do", "ToDoList", ROOT_DIR / "Smart To Do List" / "ToDoList.py", False),
+    ("Clock", "clock", ROOT_DIR / "Digital Clock & Stopwatch" / "clock.py", True),
+]
+
+# Functions timed under --profile even when Tk does not call them directly
+# (timer callbacks such as the clock's update_stopwatch are timed by the Scheduler)
+HOT_PATHS = {
+    "expense": ["load_table"],
+    "ToDoList": ["SmartToDoApp._load_tasks_into_view", "TaskManager.save"],
+}
+PROFILE_FILE = "tk_profile.json"
+
+# ---------------------------
+# Shared timer
+# ---------------------------
+class Scheduler:
+    """Multiplexes timers onto a single Tk `after` job.
+
+    Offers the same after/after_cancel calls as a widget, so a tool can be
+    handed either this or its own window. `dispatch`, when set, is called as
+    dispatch(func, *args) in place of each timer callback.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.dispatch = None
+        self._queue = []  # heap of (due, job id, func, args)
+        self._pending = set()
+        self._ids = itertools.count(1)
+        self._job = None
+        self._armed_for = None
+
+    def after(self, ms, func, *args):
+        job = next(self._ids)
+        heapq.heappush(self._queue, (time.monotonic() + ms / 1000, job, func, args))
+        self._pending.add(job)
+        self._arm()
+        return job
+
+    def after_cancel(self, job):
+        self._pending.discard(job)
+
+    def _arm(self):
+        while self._queue and self._queue[0][1] not in self._pending:
+            heapq.heappop(self._queue)
+        if not self._queue:
+            return
+        due = self._queue[0][0]
+        if self._job is not None:
+            if due >= self._armed_for:
+                return
+            self.root.after_cancel(self._job)
+        self._armed_for = due
+        delay = max(0, math.ceil((due - time.monotonic()) * 1000))
+        self._job = self.root.after(delay, self._fire)
+
+    def _fire(self):
+        self._job = None
+        now = time.monotonic()
+        while self._queue and self._queue[0][0] <= now:
+            _, job, func, args = heapq.heappop(self._queue)
+            if job not in self._pending:
+                continue
+            self._pending.discard(job)
+            try:
+                if self.dispatch is None:
+                    func(*args)
+                else:
+                    self.dispatch(func, *args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        self._arm()
+
+# ---------------------------
+# Lazy tool loading
+# ---------------------------
+def load_tool(name, path):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[name]
+        raise
+    return module
+
+class Launcher(tk.Tk):
+    def __init__(self, profiler=None, profile_path=PROFILE_FILE):
+        super().__init__()
+        # hooks must be in place before any widget registers a callback
+        self.profiler = profiler
+        self.profile_path = profile_path
+        if profiler is not None:
+            profiler.install(self)
+            self.bind("<F12>", lambda e: profiler.show_overlay())
+        self.title("Tkinter Tools")
+        self.geometry("900x600")
+        self.minsize(700, 450)
+        self.scheduler = Scheduler(self)
+        if profiler is not None:
+            self.scheduler.dispatch = profiler.dispatch
+        self.tools = {}  # tab frame -> built tool (module or widget)
+
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True)
+        self._specs = {}
+        for label, name, path, timed in TOOLS:
+            tab = tk.Frame(self.notebook)
+            self.notebook.add(tab, text=label)
+            self._specs[str(tab)] = (name, path, timed)
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._open_current())
+        self._open_current()
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def _open_current(self):
+        tab = self.notebook.select()
+        if not tab or tab in self.tools:
+            return
+        name, path, timed = self._specs[tab]
+        frame = self.nametowidget(tab)
+        module = load_tool(name, path)
+        if self.profiler is not None:
+            for hot_path in HOT_PATHS.get(name, []):
+                self.profiler.wrap(module, hot_path)
+        if timed:
+            built = module.build(frame, self.scheduler)
+        else:
+            built = module.build(frame)
+        self.tools[tab] = built if built is not None else module
+
+    def on_closing(self):
+        # let the to-do reminder thread wind down before the root goes away
+        for built in self.tools.values():
+            if hasattr(built, "_stop_thread"):
+                built._stop_thread = True
+        if self.profiler is not None:
+            self.profiler.uninstall()
+            self.profiler.dump(self.profile_path)
+            print(f"Event-loop profile written to {self.profile_path}")
+        self.destroy()
+
+# ---------------------------
+# Cold-start measurement
+# ---------------------------
+def _probe(name=None):
+    """Start like a fresh process would, draw once and exit."""
+    if name is None:
+        app = Launcher()
+        app.update()
+    else:
+        _, name, path, timed = next(t for t in TOOLS if t[1] == name)
+        app = tk.Tk()
+        module = load_tool(name, path)
+        built = module.build(app, app) if timed else module.build(app)
+        app.update()
+        if hasattr(built, "_stop_thread"):
+            built._stop_thread = True
+    app.destroy()
+
+def _time_process(args, runs):
+    best = math.inf
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(Path(__file__).resolve()), "--probe", *args],
+                       check=True, cwd=ROOT_DIR)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def measure(runs=5):
+    print(f"Cold start, best of {runs} (interpreter + Tk + first draw):")
+    separate = 0.0
+    for label, name, path, timed in TOOLS:
+        t = _time_process([name], runs)
+        separate += t
+        print(f"  {label:<12}{t * 1000:8.1f} ms")
+    print(f"  {'all four':<12}{separate * 1000:8.1f} ms  (separate scripts)")
+    t = _time_process([], runs)
+    print(f"  {'launcher':<12}{t * 1000:8.1f} ms  (first tab only, rest lazy)")
+
+# ---------------------------
+# Main
+# ---------------------------
+def main():
+    if "--probe" in sys.argv:
+        rest = sys.argv[sys.argv.index("--probe") + 1:]
+        _probe(rest[0] if rest else None)
+    elif "--measure" in sys.argv:
+        measure()
+    elif "--profile" in sys.argv:
+        from profiler import Profiler
+        rest = sys.argv[sys.argv.index("--profile") + 1:]
+        Launcher(Profiler(), rest[0] if rest else PROFILE_FILE).mainloop()
+    else:
+        Launcher().mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+profiler.py
+Opt-in event-loop latency profiler for the Tkinter tools.
+
+- Times every Tk command, binding and `after` callback, per handler
+- Hot paths that are not Tk callbacks can be wrapped by name
+- A watchdog thread flags main-loop stalls longer than a threshold
+- Results dump to JSON or show in a small overlay window
+
+Nothing is patched until Profiler.install() is called, so the tools run
+unchanged when profiling is off. `python launcher.py --profile` turns it on.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import functools
+import json
+import threading
+import time
+import sys
+
+STALL_THRESHOLD_MS = 200
+HEARTBEAT_MS = 50
+# histogram bucket upper bounds in ms; the last bucket is open ended
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+BEAT_NAME = "_profiler_heartbeat"
+
+def _bucket_names():
+    names = [f"<{b}ms" for b in BUCKETS_MS]
+    names.append(f">={BUCKETS_MS[-1]}ms")
+    return names
+
+def _label(func):
+    func = getattr(func, "__func__", func)
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None:
+        return repr(func)
+    # Misc.after registers a closure that only copies the target's __name__
+    if qualname.endswith("after.<locals>.callit"):
+        if func.__name__ == BEAT_NAME:
+            return None
+        return f"after:{func.__name__}"
+    return f"{getattr(func, '__module__', '?')}.{qualname}"
+
+# ---------------------------
+# Per-handler statistics
+# ---------------------------
+class HandlerStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.nested = 0  # calls that ran a nested event loop (e.g. wait_window)
+        self.histogram = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, ms):
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms < bound:
+                self.histogram[i] += 1
+                return
+        self.histogram[-1] += 1
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile."""
+        if not self.count:
+            return 0.0
+        seen = 0
+        for i, n in enumerate(self.histogram):
+            seen += n
+            if seen >= self.count * p:
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p95_ms": self.percentile(0.95),
+            "nested": self.nested,
+            "histogram": dict(zip(_bucket_names(), self.histogram)),
+        }
+
+# ---------------------------
+# Profiler
+# ---------------------------
+class Profiler:
+    def __init__(self, stall_threshold_ms=STALL_THRESHOLD_MS):
+        self.stall_threshold = stall_threshold_ms / 1000
+        self.stats = {}  # handler label -> HandlerStats
+        self.stalls = []
+        self.root = None
+        self.overlay = None
+        self._stack = []  # labels of handlers currently running
+        self._beats = 0
+        self._last_beat = time.monotonic()
+        self._stall_handler = None
+        self._original_call = None
+        self._stop = threading.Event()
+
+    # ---- hooks ----
+    def install(self, root):
+        """Patch Tk callback dispatch and start the heartbeat and watchdog.
+
+        Must run before the UI is built: tkinter binds CallWrapper.__call__
+        when a callback is registered.
+        """
+        if self._original_call is not None:
+            return
+        self.root = root
+        original = self._original_call = tk.CallWrapper.__call__
+        profiler = self
+
+        def __call__(wrapper, *args):
+            try:
+                label = wrapper._profile_label
+            except AttributeError:
+                label = wrapper._profile_label = _label(wrapper.func)
+            if label is None:
+                return original(wrapper, *args)
+            return profiler._timed(label, original, wrapper, *args)
+
+        tk.CallWrapper.__call__ = __call__
+        self._last_beat = time.monotonic()
+        self._profiler_heartbeat()
+        threading.Thread(target=self._watchdog, daemon=True).start()
+
+    def uninstall(self):
+        if self._original_call is None:
+            return
+        tk.CallWrapper.__call__ = self._original_call
+        self._original_call = None
+        self._stop.set()
+
+    def wrap(self, owner, dotted_name):
+        """Time a module function or class method that Tk does not call directly."""
+        *path, attr = dotted_name.split(".")
+        target = owner
+        for part in path:
+            target = getattr(target, part)
+        func = getattr(target, attr)
+        label = f"{getattr(owner, '__name__', owner)}.{dotted_name}"
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            # calls from worker threads (e.g. the reminder thread) never block the loop
+            if threading.current_thread() is not threading.main_thread():
+                return func(*args, **kwargs)
+            return self._timed(label, func, *args, **kwargs)
+
+        setattr(target, attr, timed)
+
+    def dispatch(self, func, *args):
+        """Run a callback fired by a shared timer, timed under its own name."""
+        label = f"after:{getattr(func, '__name__', repr(func))}"
+        return self._timed(label, func, *args)
+
+    def _timed(self, label, func, *args, **kwargs):
+        beats = self._beats
+        self._stack.append(label)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            self._stack.pop()
+            stats = self.stats.get(label)
+            if stats is None:
+                stats = self.stats[label] = HandlerStats()
+            if self._beats != beats:
+                # the loop kept turning while this ran, so it was not blocking
+                stats.nested += 1
+            else:
+                stats.add(ms)
+
+    # ---- stall detection ----
+    def _profiler_heartbeat(self):
+        now = time.monotonic()
+        gap = now - self._last_beat
+        if self._stall_handler is not None:
+            self.stalls.append({
+                "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "duration_ms": round(gap * 1000 - HEARTBEAT_MS, 1),
+                "handler": self._stall_handler,
+            })
+            self._stall_handler = None
+        self._last_beat = now
+        self._beats += 1
+        if self._original_call is not None:
+            self.root.after(HEARTBEAT_MS, self._profiler_heartbeat)
+
+    def _watchdog(self):
+        interval = self.stall_threshold / 4
+        while not self._stop.wait(interval):
+            if self._stall_handler is not None:
+                continue
+            if time.monotonic() - self._last_beat > self.stall_threshold + HEARTBEAT_MS / 1000:
+                handler = self._stack[-1] if self._stack else "Tk (redraw / idle tasks)"
+                self._stall_handler = handler
+                print(f"[STALL] main loop blocked > {self.stall_threshold * 1000:.0f} ms in {handler}",
+                      file=sys.stderr)
+
+    # ---- output ----
+    def report(self):
+        handlers = sorted(self.stats.items(), key=lambda kv: kv[1].total, reverse=True)
+        return {
+            "stall_threshold_ms": self.stall_threshold * 1000,
+            "handlers": {label: s.to_dict() for label, s in handlers},
+            "stalls": list(self.stalls),
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def show_overlay(self):
+        if self.overlay is not None and self.overlay.winfo_exists():
+            self.overlay.lift()
+            return
+        self.overlay = ProfilerOverlay(self.root, self)
+
+# ---------------------------
+# Overlay window
+# ---------------------------
+class ProfilerOverlay(tk.Toplevel):
+    REFRESH_MS = 1000
+
+    def __init__(self, parent, profiler):
+        super().__init__(parent)
+        self.title("Event-loop profiler")
+        self.geometry("640x300")
+        self.attributes("-topmost", True)
+        self.profiler = profiler
+
+        columns = ("handler", "count", "mean", "p95", "max", "total")
+        headings = ("Handler", "Calls", "Mean ms", "P95 ms", "Max ms", "Total ms")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        for col, text, width in zip(columns, headings, (300, 60, 60, 60, 70, 80)):
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=width, anchor="w" if col == "handler" else "e")
+        self.tree.pack(fill="both", expand=True)
+        self.stall_label = ttk.Label(self, anchor="w", padding=(6,4))
+        self.stall_label.pack(fill="x")
+        self._refresh()
+
+    def _refresh(self):
+        if not self.winfo_exists():
+            return
+        self.tree.delete(*self.tree.get_children())
+        for label, s in self.profiler.report()["handlers"].items():
+            self.tree.insert("", "end", values=(label, s["count"], f"{s['mean_ms']:.1f}",
+                                                s["p95_ms"], f"{s['max_ms']:.1f}", f"{s['total_ms']:.0f}"))
+        stalls = self.profiler.stalls
+        text = f"Stalls over {self.profiler.stall_threshold * 1000:.0f} ms: {len(stalls)}"
+        if stalls:
+            last = stalls[-1]
+            text += f"    last: {last['duration_ms']} ms in {last['handler']} at {last['at']}"
+        self.stall_label.config(text=text)
+        self.after(self.REFRESH_MS, self._refresh)